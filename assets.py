@@ -0,0 +1,55 @@
+# assets.py
+
+"""
+Background image loading.
+
+`AssetLoader` loads a set of named images on a worker thread so the first
+frame does not wait on disk I/O. `get` blocks until the requested image is
+ready, and `progress` reports how many images have finished so far.
+"""
+
+import threading
+import pygame
+
+
+class AssetLoader:
+    def __init__(self, assets, on_complete=None):
+        # assets: {name: (path, size or None)}
+        self.assets = dict(assets)
+        self.on_complete = on_complete
+        self.images = {}
+        self.errors = {}
+        self.ready = {name: threading.Event() for name in self.assets}
+        self.thread = threading.Thread(target=self._load_all, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def _load_all(self):
+        for name, (path, size) in self.assets.items():
+            try:
+                image = pygame.image.load(path)
+                if size:
+                    image = pygame.transform.scale(image, size)
+                self.images[name] = image
+            except (pygame.error, OSError) as e:
+                self.errors[name] = e
+            self.ready[name].set()
+        if self.on_complete:
+            self.on_complete()
+
+    def get(self, name):
+        self.ready[name].wait()
+        if name in self.errors:
+            raise self.errors[name]
+        return self.images[name]
+
+    def progress(self):
+        loaded = sum(1 for event in self.ready.values() if event.is_set())
+        return loaded, len(self.ready)
+
+    @property
+    def done(self):
+        loaded, total = self.progress()
+        return loaded == total
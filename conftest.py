@@ -0,0 +1,4 @@
+# conftest.py
+
+# Lets pytest put the repository root on sys.path so tests can import
+# `models`, `frame_cache`, ... the same way prism.py does.
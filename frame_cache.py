@@ -0,0 +1,54 @@
+# frame_cache.py
+
+"""
+Size-bounded LRU cache of composited frames.
+
+Entries are keyed by (view, surface size, Board.frame_key()). Each entry
+also keeps the board's plate states so that a hash collision is treated as
+a miss instead of showing the wrong frame.
+"""
+
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def board_state(board):
+    return tuple(plate.state_key() for plate in board.plates)
+
+
+class FrameCache:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, view, board, size, render):
+        key = (view, size, board.frame_key())
+        state = board_state(board)
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] == state:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        surface = render()
+        self.put(key, state, surface)
+        return surface
+
+    def put(self, key, state, surface):
+        if key in self.entries:
+            self.size_bytes -= self._surface_bytes(self.entries.pop(key)[1])
+        self.entries[key] = (state, surface)
+        self.size_bytes += self._surface_bytes(surface)
+        while self.size_bytes > self.max_bytes and len(self.entries) > 1:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.size_bytes -= self._surface_bytes(evicted)
+
+    @staticmethod
+    def _surface_bytes(surface):
+        width, height = surface.get_size()
+        return width * height * surface.get_bytesize()
@@ -1,5 +1,6 @@
 # models/board.py
 
+import hashlib
 import pygame
 from constants import LIGHT_GRID, CELL_SIZE
 from models.plate import Plates
@@ -14,6 +15,9 @@ class Board:
         self.width = 600
         self.height = 450
         self.cellWidth = CELL_SIZE
+        # XOR of one hash per (z-index, plate state), kept up to date by the
+        # mutators below so frame_key() never rehashes the whole board
+        self._frame_key = 0
 
     def draw_grid(self, screen):
         for x in range(41):
@@ -37,8 +41,53 @@ class Board:
 
     def add_plate(self, plate):
         self.plates.append(plate)
+        self._frame_key ^= self._slot_hash(len(self.plates) - 1)
+
+    def clear(self):
+        self.plates.clear()
+        self._frame_key = 0
 
     def bring_to_top(self, plate):
         if plate in self.plates:
-            self.plates.remove(plate)
-            self.plates.append(plate)
+            self.move_to_index(plate, len(self.plates) - 1)
+
+    def move_to_index(self, plate, index):
+        old_index = self.plates.index(plate)
+        if old_index == index:
+            return
+        lo, hi = min(old_index, index), max(old_index, index)
+        for i in range(lo, hi + 1):
+            self._frame_key ^= self._slot_hash(i)
+        self.plates.remove(plate)
+        self.plates.insert(index, plate)
+        for i in range(lo, hi + 1):
+            self._frame_key ^= self._slot_hash(i)
+
+    def move_plate(self, plate, location):
+        i = self.plates.index(plate)
+        self._frame_key ^= self._slot_hash(i)
+        plate.plate_location = location
+        plate.xy_to_coordinates()
+        self._frame_key ^= self._slot_hash(i)
+
+    def set_plate_color(self, plate, color):
+        i = self.plates.index(plate)
+        self._frame_key ^= self._slot_hash(i)
+        plate.plate_color = color
+        self._frame_key ^= self._slot_hash(i)
+
+    def _slot_hash(self, index):
+        return hash((index, self.plates[index].state_key()))
+
+    def frame_key(self):
+        # In-process key for caching rendered frames; see state_hash for a
+        # stable digest that can be stored on disk
+        return self._frame_key
+
+    def state_hash(self):
+        # Plate order is the z-order, so it is part of the state
+        digest = hashlib.sha1()
+        for plate in self.plates:
+            digest.update(repr((plate.plate_type, plate.plate_color,
+                                plate.plate_location, plate.plate_xys)).encode())
+        return digest.hexdigest()
@@ -0,0 +1,64 @@
+# models/history.py
+
+class History:
+    """
+    Undo/redo for plate edits. Each entry stores only the delta of one
+    user action, and is replayed through the Board mutators so the
+    board's frame key stays in sync.
+
+    Deltas:
+    - ("move", plate, old_index, new_index, old_location, new_location)
+    - ("color", plate, old_color, new_color)
+    """
+
+    def __init__(self, board):
+        self.board = board
+        self.undo_stack = []
+        self.redo_stack = []
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+
+    def record_move(self, plate, old_index, old_location):
+        new_index = self.board.plates.index(plate)
+        new_location = plate.plate_location
+        if (old_index, old_location) != (new_index, new_location):
+            self._push(("move", plate, old_index, new_index, old_location, new_location))
+
+    def record_color(self, plate, old_color):
+        if old_color != plate.plate_color:
+            self._push(("color", plate, old_color, plate.plate_color))
+
+    def _push(self, delta):
+        self.undo_stack.append(delta)
+        self.redo_stack.clear()
+
+    def undo(self):
+        if not self.undo_stack:
+            return False
+        delta = self.undo_stack.pop()
+        self._apply(delta, reverse=True)
+        self.redo_stack.append(delta)
+        return True
+
+    def redo(self):
+        if not self.redo_stack:
+            return False
+        delta = self.redo_stack.pop()
+        self._apply(delta, reverse=False)
+        self.undo_stack.append(delta)
+        return True
+
+    def _apply(self, delta, reverse):
+        if delta[0] == "move":
+            _, plate, old_index, new_index, old_location, new_location = delta
+            if reverse:
+                self.board.move_plate(plate, old_location)
+                self.board.move_to_index(plate, old_index)
+            else:
+                self.board.move_to_index(plate, new_index)
+                self.board.move_plate(plate, new_location)
+        elif delta[0] == "color":
+            _, plate, old_color, new_color = delta
+            self.board.set_plate_color(plate, old_color if reverse else new_color)
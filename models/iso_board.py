@@ -61,7 +61,10 @@ class IsoBoard:
         return isoPlates
 
     def draw_board(self, screen, blit_position=(0, 0)):
-        width, height = screen.get_size()
+        screen.blit(self.composite(screen.get_size()), blit_position)
+
+    def composite(self, size):
+        width, height = size
         blended_surface = pygame.Surface((width, height), pygame.SRCALPHA)
         rgb_sum = numpy.zeros((width, height, 3), dtype=numpy.float32)
         count = numpy.zeros((width, height), dtype=numpy.uint8)
@@ -82,21 +85,24 @@ class IsoBoard:
 
         final_surface = pygame.surfarray.make_surface(result_array)
         final_surface.set_alpha(255)
-        screen.blit(final_surface, blit_position)
+        return final_surface
 
-    def draw_grid(self):
+    @staticmethod
+    def draw_grid(screen=None):
+        if screen is None:
+            screen = pygame.display.get_surface()
         for x in range(0, 41, 5):
             pygame.draw.line(
-                pygame.display.get_surface(), LIGHT_GRID,
-                self.conversion(x, 0),
-                self.conversion(x, 30),
+                screen, LIGHT_GRID,
+                IsoBoard.conversion(x, 0),
+                IsoBoard.conversion(x, 30),
                 1
             )
         for y in range(0, 31, 5):
             pygame.draw.line(
-                pygame.display.get_surface(), LIGHT_GRID,
-                self.conversion(0, y),
-                self.conversion(40, y),
+                screen, LIGHT_GRID,
+                IsoBoard.conversion(0, y),
+                IsoBoard.conversion(40, y),
                 1
             )
 
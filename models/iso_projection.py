@@ -12,7 +12,10 @@ class IsoProjection:
         self.offset = offset
 
     def draw_projection(self, screen, blit_position=(500, 0)):
-        width, height = screen.get_size()
+        screen.blit(self.composite(screen.get_size()), blit_position)
+
+    def composite(self, size):
+        width, height = size
         blended_surface = pygame.Surface((width, height), pygame.SRCALPHA)
         rgb_sum = numpy.zeros((width, height, 3), dtype=numpy.float32)
         count = numpy.zeros((width, height), dtype=numpy.uint8)
@@ -39,4 +42,4 @@ class IsoProjection:
 
         final_surface = pygame.surfarray.make_surface(result_array)
         final_surface.set_alpha(255)
-        screen.blit(final_surface, blit_position)
+        return final_surface
@@ -84,16 +84,28 @@ class Level:
             {'type':2, 'color':GRAY, 'location':(8,15), 'xys':[(4*2**0.5,4*2**0.5)]}
         ]}
 
-    def __init__(self, level_id):
+    def __init__(self, level_id, assets=None):
         self.level_id = level_id
         self.plate_definitions = Level.level_data[level_id]
         self.answer = Level.level_answer[level_id]
-        self.target = self.load_level_icon()
+        self.assets = assets
+        self._target = None
         self.level_name = Level.level_names[level_id - 1]
 
+    @property
+    def target(self):
+        # The icon is only needed on the result screen, so load it on first use
+        if self._target is None:
+            self._target = self.load_level_icon()
+        return self._target
+
     def load(self, board):
-        board.plates.clear()
-        for spec in self.plate_definitions:
+        Level.load_definitions(board, self.plate_definitions)
+
+    @staticmethod
+    def load_definitions(board, plate_definitions):
+        board.clear()
+        for spec in plate_definitions:
             plate = Plates(
                 spec['type'],
                 spec.get('color', GRAY),
@@ -102,13 +114,19 @@ class Level:
             )
             board.add_plate(plate)
 
-    def load_level_icon(self):
-        filename = IMAGE_FILENAMES[self.level_id - 1]
+    @staticmethod
+    def icon_path(level_id):
+        filename = IMAGE_FILENAMES[level_id - 1]
         curr_dir = os.path.dirname(os.path.abspath(__file__))
         image_dir = os.path.join(curr_dir, '..', 'images')
-        path = os.path.join(image_dir, filename)
-        image = pygame.image.load(path).convert_alpha()
-        return image
+        return os.path.join(image_dir, filename)
+
+    def load_level_icon(self):
+        if self.assets is not None:
+            image = self.assets.get(IMAGE_FILENAMES[self.level_id - 1])
+        else:
+            image = pygame.image.load(Level.icon_path(self.level_id))
+        return image.convert_alpha()
     
     def draw_level_icon(self, screen, pos=(-60, -20), size=(320, 240)):
         icon = pygame.transform.smoothscale(self.target, size)
@@ -12,8 +12,12 @@ class Plates:
         self.plate_coordinates = [(0, 0)] * len(plate_xys)
         self.button_rect = pygame.Rect(0, 0, 10, 10)
         self.dragging = False
+        self._xys_key = tuple(map(tuple, plate_xys))
         self.xy_to_coordinates()
 
+    def state_key(self):
+        return (self.plate_type, self.plate_color, self.plate_location, self._xys_key)
+
     def draw_plate(self, screen):
         temp_surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
         if self.plate_type == 1:
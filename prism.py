@@ -24,23 +24,49 @@ Interface Features:
 - Press ENTER to check solution and view result screen
 - Level Selection on startup (6 levels)
 - Home button (top-left) to return to level select
+- Press Ctrl+Z / Ctrl+Y to undo/redo plate moves and color changes
+
+Startup:
+- Only the start screen image is loaded before the first frame; the other
+  images load on a background thread (see assets.py)
+- The iso modules are imported when the iso view is first entered (pygame
+  itself still imports NumPy); level-select thumbnails that are not cached
+  yet render in worker processes
+- Run `python prism.py --startup-report` to print time-to-first-frame on exit
+
+Session Recording:
+- Run `python prism.py --record session.prs` to log input events to a file
+- Run `python replay.py session.prs` to replay it headless (see replay.py)
 """
 
-import pygame
+import argparse
 import sys
+import threading
+from utils import StartupTimer, additive_blend
+
+# Started before pygame is imported so the report includes import time
+startup_timer = StartupTimer()
+
+import pygame
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT, LIGHT_GRID, REDD, GREEND, BLUED
-from utils import additive_blend
+from assets import AssetLoader
+from frame_cache import FrameCache
 from models.board import Board
-from models.level import Level
-from models.iso_board import IsoBoard
-from models.iso_projection import IsoProjection
+from models.history import History
+from models.level import Level, IMAGE_FILENAMES
+from replay import SessionRecorder
+
+startup_timer.mark("imports")
 
-# === Initialize pygame ===
-pygame.init()
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Luminara Demo")
-FONT = pygame.font.SysFont("couriernew", 48)
-BUTTON_FONT = pygame.font.SysFont("couriernew", 32)
+# === Assets ===
+START_IMAGE = "images/start.jpg"
+BACKGROUND_ASSETS = {
+    "instruction": ("images/instruction.png", None),
+    "bg": ("images/bg.png", None),
+    "home": ("images/home.png", (40, 40)),
+}
+for lvl in range(1, len(IMAGE_FILENAMES) + 1):
+    BACKGROUND_ASSETS[IMAGE_FILENAMES[lvl - 1]] = (Level.icon_path(lvl), None)
 
 # === Colors & Buttons ===
 WHITE = additive_blend([REDD, GREEND, BLUED])
@@ -50,28 +76,6 @@ color_buttons = [
     (BLUED, pygame.Rect(720, 350, 50, 50))
 ]
 
-# === Load Assets ===
-start_image = pygame.image.load("images/start.jpg")
-instruction_image = pygame.image.load("images/instruction.png")
-bg = pygame.image.load("images/bg.png")
-home_icon = pygame.image.load("images/home.png")
-home_icon = pygame.transform.scale(home_icon, (40, 40))
-home_icon_rect = home_icon.get_rect(topleft=(20, 20))
-
-# === State Variables ===
-selected_color = None
-selected_plate = None
-show_isometric = False
-show_start_screen = True
-show_instruction_screen = False
-show_result_screen = False
-show_level_select = True
-result_text = ""
-current_level = None
-board = Board()
-level = None
-level_completed = []
-
 # === Level Selection Layout ===
 BUTTON_WIDTH = 120
 BUTTON_HEIGHT = 60
@@ -98,11 +102,13 @@ next_text_rect = pygame.Rect(SCREEN_WIDTH - 150, SCREEN_HEIGHT - 60, 120, 40)
 back_text_rect = pygame.Rect(50, SCREEN_HEIGHT - 60, 120, 40)
 
 # === Helpers ===
-def draw_color_buttons():
-    for color, rect in color_buttons:
-        pygame.draw.rect(screen, color, rect)
+def init_display():
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Luminara Demo")
+    return screen
 
-def check_answer(board, current_level):
+def check_answer(board, current_level, level_completed):
     answer = Level.level_answer[current_level]
     initial = answer[0][2]
     for plate in board.plates:
@@ -122,176 +128,369 @@ def check_answer(board, current_level):
     level_completed.append(current_level)
     return True
 
-# === Main Loop ===
-running = True
-while running:
-    # Event Handling
-    for event in pygame.event.get():
+
+class Game:
+    """
+    Game state machine. `handle_event` consumes one pygame event and
+    `draw` renders the current screen, so the same logic can be driven
+    by the live event loop or by a recorded session (see replay.py).
+    """
+
+    def __init__(self, screen, timer=None, thumbnails=True):
+        self.screen = screen
+        self.timer = timer or StartupTimer()
+        self.FONT = pygame.font.SysFont("couriernew", 48)
+        self.BUTTON_FONT = pygame.font.SysFont("couriernew", 32)
+
+        # === Load Assets ===
+        # Only the start screen is needed for the first frame
+        self.start_image = pygame.image.load(START_IMAGE)
+        self.assets = AssetLoader(
+            BACKGROUND_ASSETS, on_complete=lambda: self.timer.mark("assets loaded")
+        ).start()
+        self.home_icon_rect = pygame.Rect(20, 20, 40, 40)
+        self.iso_modules = None
+
+        # === State Variables ===
+        self.running = True
+        self.selected_color = None
+        self.selected_plate = None
+        self.drag_start = None
+        self.show_isometric = False
+        self.show_start_screen = True
+        self.show_instruction_screen = False
+        self.show_result_screen = False
+        self.show_level_select = True
+        self.result_text = ""
+        self.button_text = ""
+        self.current_level = None
+        self.board = Board()
+        self.history = History(self.board)
+        self.frame_cache = FrameCache()
+        self.level = None
+        self.level_completed = []
+
+        # === Level Select Thumbnails ===
+        # Off for replays so frame times do not depend on .thumbnails/
+        self.thumbnails = thumbnails
+        self.thumbnail_cache = None
+        self.level_thumbnails = {}
+        self.thumbnails_pending = set()
+        self.thumbnails_failed = set()
+        self.thumbnail_jobs = []
+
+    @property
+    def instruction_image(self):
+        return self.assets.get("instruction")
+
+    @property
+    def bg(self):
+        return self.assets.get("bg")
+
+    @property
+    def home_icon(self):
+        return self.assets.get("home")
+
+    def load_iso_modules(self):
+        # Deferred so the iso modules are only imported once the iso view is used
+        if self.iso_modules is None:
+            from models.iso_board import IsoBoard
+            from models.iso_projection import IsoProjection
+            self.iso_modules = (IsoBoard, IsoProjection)
+            self.timer.mark("iso modules imported")
+        return self.iso_modules
+
+    def check_answer(self):
+        return check_answer(self.board, self.current_level, self.level_completed)
+
+    def level_thumbnail(self, lvl):
+        # Only cached thumbnails are loaded here; a miss returns None and
+        # queues the level for start_thumbnail_render
+        if not self.thumbnails:
+            return None
+        if lvl in self.level_thumbnails:
+            return self.level_thumbnails[lvl]
+        if lvl in self.thumbnails_pending or lvl in self.thumbnails_failed:
+            return None
+        # Imported here to keep the thumbnail code off the cold-start path
+        from render import ThumbnailCache, level_board, LEVEL_THUMBNAIL_VIEW, LEVEL_THUMBNAIL_SIZE
+        if self.thumbnail_cache is None:
+            self.thumbnail_cache = ThumbnailCache()
+        thumbnail = self.thumbnail_cache.load(level_board(lvl), LEVEL_THUMBNAIL_VIEW, LEVEL_THUMBNAIL_SIZE)
+        if thumbnail is None:
+            self.thumbnails_pending.add(lvl)
+            self.thumbnail_jobs.append((lvl, Level.level_data[lvl], LEVEL_THUMBNAIL_VIEW, LEVEL_THUMBNAIL_SIZE, None))
+            return None
+        thumbnail.set_colorkey((0, 0, 0))
+        self.level_thumbnails[lvl] = thumbnail
+        return thumbnail
+
+    def start_thumbnail_render(self):
+        # Render in worker processes so the game loop never runs the
+        # composite; each level is loaded from the cache once it is done
+        from render import render_batch
+        jobs, self.thumbnail_jobs = self.thumbnail_jobs, []
+        threading.Thread(target=render_batch, args=(jobs,),
+                         kwargs={"on_done": self.thumbnail_done},
+                         daemon=True).start()
+
+    def thumbnail_done(self, outcome):
+        lvl, _, _, error = outcome
+        if error is not None:
+            # Keep the text-only button rather than retrying every frame
+            self.thumbnails_failed.add(lvl)
+        self.thumbnails_pending.discard(lvl)
+
+    def draw_color_buttons(self):
+        for color, rect in color_buttons:
+            pygame.draw.rect(self.screen, color, rect)
+
+    def handle_event(self, event):
         if event.type == pygame.QUIT:
-            running = False
+            self.running = False
 
-        if show_start_screen:
+        if self.show_start_screen:
             if event.type == pygame.MOUSEBUTTONDOWN and enter_text_rect.collidepoint(event.pos):
-                show_start_screen = False
-                show_instruction_screen = True
-            continue
+                self.show_start_screen = False
+                self.show_instruction_screen = True
+            return
 
-        if show_instruction_screen:
+        if self.show_instruction_screen:
             if event.type == pygame.MOUSEBUTTONDOWN and next_text_rect.collidepoint(event.pos):
-                show_instruction_screen = False
-                show_level_select = True
-            continue
+                self.show_instruction_screen = False
+                self.show_level_select = True
+            return
 
         # Level selection input
-        if show_level_select:
+        if self.show_level_select:
             if event.type == pygame.MOUSEBUTTONDOWN:
                 for lvl, rect in level_buttons:
                     if rect.collidepoint(event.pos):
-                        current_level = lvl
-                        level = Level(current_level)
-                        level.load(board)
-                        show_level_select = False
-                        show_result_screen = True
-                        result_text = f"{level.level_name}"
-                        button_text = "Start"
+                        self.current_level = lvl
+                        self.level = Level(self.current_level, self.assets)
+                        self.level.load(self.board)
+                        self.history.clear()
+                        self.show_level_select = False
+                        self.show_result_screen = True
+                        self.result_text = f"{self.level.level_name}"
+                        self.button_text = "Start"
             if event.type == pygame.MOUSEBUTTONDOWN and back_text_rect.collidepoint(event.pos):
-                show_level_select = False
-                show_instruction_screen = True
-            continue
+                self.show_level_select = False
+                self.show_instruction_screen = True
+            return
 
         if event.type == pygame.MOUSEBUTTONDOWN:
-            if home_icon_rect.collidepoint(event.pos):
-                show_level_select = True
-                show_result_screen = False
-                show_isometric = False
+            if self.home_icon_rect.collidepoint(event.pos):
+                self.show_level_select = True
+                self.show_result_screen = False
+                self.show_isometric = False
 
-        if show_result_screen:
+        if self.show_result_screen:
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if home_button.collidepoint(event.pos):
-                    show_result_screen = False
-                    if check_answer(board, current_level): show_level_select = True
+                    self.show_result_screen = False
+                    if self.check_answer(): self.show_level_select = True
             # if event.type == pygame.MOUSEBUTTONDOWN and back_text_rect.collidepoint(event.pos):
-            #     show_level_select = True
-            continue
+            #     self.show_level_select = True
+            return
 
         # Game input
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
-                show_isometric = not show_isometric
+                self.show_isometric = not self.show_isometric
+            elif event.key in (pygame.K_z, pygame.K_y) and event.mod & (pygame.KMOD_CTRL | pygame.KMOD_META):
+                if not self.selected_plate:
+                    redo = event.key == pygame.K_y or event.mod & pygame.KMOD_SHIFT
+                    if redo:
+                        self.history.redo()
+                    else:
+                        self.history.undo()
             elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
-                show_result_screen = True
-                result_text = "Win :D" if check_answer(board, current_level) else "Try again :("
-                button_text = "Home" if check_answer(board, current_level) else "Back"
+                self.show_result_screen = True
+                self.result_text = "Win :D" if self.check_answer() else "Try again :("
+                self.button_text = "Home" if self.check_answer() else "Back"
 
         elif event.type == pygame.MOUSEBUTTONDOWN:
             for color, rect in color_buttons:
                 if rect.collidepoint(event.pos):
-                    selected_color = color
+                    self.selected_color = color
                     break
             else:
-                selected_plate = board.get_plate_at(event.pos)
-                if selected_plate:
-                    if selected_color:
-                        selected_plate.plate_color = selected_color
-                        selected_color = None
+                self.selected_plate = self.board.get_plate_at(event.pos)
+                if self.selected_plate:
+                    self.drag_start = (self.board.plates.index(self.selected_plate),
+                                       self.selected_plate.plate_location)
+                    if self.selected_color:
+                        old_color = self.selected_plate.plate_color
+                        self.board.set_plate_color(self.selected_plate, self.selected_color)
+                        self.history.record_color(self.selected_plate, old_color)
+                        self.selected_color = None
                     else:
-                        selected_plate.dragging = True
-                        board.bring_to_top(selected_plate)
+                        self.selected_plate.dragging = True
+                        self.board.bring_to_top(self.selected_plate)
 
         elif event.type == pygame.MOUSEBUTTONUP:
-            if selected_plate:
+            if self.selected_plate:
                 x = round((event.pos[0] - 100) / 15)
                 y = round((event.pos[1] - 75) / 15)
-                selected_plate.plate_location = (x, y)
-                selected_plate.xy_to_coordinates()
-                selected_plate.dragging = False
-                selected_plate = None
+                self.board.move_plate(self.selected_plate, (x, y))
+                self.history.record_move(self.selected_plate, *self.drag_start)
+                self.selected_plate.dragging = False
+                self.selected_plate = None
 
-        elif event.type == pygame.MOUSEMOTION and selected_plate and selected_plate.dragging:
+        elif event.type == pygame.MOUSEMOTION and self.selected_plate and self.selected_plate.dragging:
             x = (event.pos[0] - 100) / 15
             y = (event.pos[1] - 75) / 15
-            selected_plate.plate_location = (x, y)
-            selected_plate.xy_to_coordinates()
-
-    # === Drawing ===
-    if show_start_screen:
-        screen.blit(pygame.transform.scale(start_image, (SCREEN_WIDTH, SCREEN_HEIGHT)), (0, 0))
-        txt = BUTTON_FONT.render("Enter the Game", True, (255, 255, 255))
-        screen.blit(txt, txt.get_rect(center=enter_text_rect.center))
-
-    elif show_instruction_screen:
-        screen.blit(pygame.transform.scale(instruction_image, (SCREEN_WIDTH, SCREEN_HEIGHT)), (0, 0))
-        txt = BUTTON_FONT.render("Next>", True, (255, 255, 255))
-        screen.blit(txt, txt.get_rect(center=next_text_rect.center))
-
-    elif show_level_select:
-        screen.blit(pygame.transform.scale(bg, (SCREEN_WIDTH, SCREEN_HEIGHT)), (0, 0))
-        title_surf = FONT.render("Select Level", True, (255, 255, 255))
-        title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 150))
-        screen.blit(title_surf, title_rect)
-        for lvl, rect in level_buttons:
-            if lvl in level_completed:
-                pygame.draw.rect(screen, (160, 160, 160), rect)
-            else:
-                pygame.draw.rect(screen, LIGHT_GRID, rect)
-            pygame.draw.rect(screen, (0, 0, 0), rect, 2)
-            txt = pygame.font.SysFont("couriernew", 24).render(Level.level_names[lvl-1], True, (0, 0, 0))
-            txt_rect = txt.get_rect(center=rect.center)
-            screen.blit(txt, txt_rect)
-        back_txt = BUTTON_FONT.render("<Back", True, (255, 255, 255))
-        screen.blit(back_txt, back_txt.get_rect(center=back_text_rect.center))
-
-    elif show_result_screen:
-        screen.blit(pygame.transform.scale(bg, (SCREEN_WIDTH, SCREEN_HEIGHT)), (0, 0))
-        level.draw_level_icon(screen, pos=(160, 60), size=(480, 360))
-        txt = FONT.render(result_text, True, (255, 255, 255))
-        screen.blit(txt, txt.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100)))
-        pygame.draw.rect(screen, LIGHT_GRID, home_button)
-        pygame.draw.rect(screen, (0, 0, 0), home_button, 2)
-        txt = BUTTON_FONT.render(button_text, True, (0, 0, 0))
-        screen.blit(txt, txt.get_rect(center=home_button.center))
-        # back_txt = BUTTON_FONT.render("<Exit", True, (0, 0, 0))
-        # screen.blit(back_txt, back_txt.get_rect(center=back_text_rect.center))
-        screen.blit(home_icon, home_icon_rect)
-
-    else:
-        screen.fill(WHITE)
-        screen.blit(home_icon, home_icon_rect)
-        if show_isometric:
-            iso_board = IsoBoard(board.plates)
-            iso_proj = IsoProjection(board.plates, scale=1.8, offset=(10, 80))
-            iso_board.draw_board(screen)
-            iso_board.draw_grid()
-            iso_proj.draw_projection(screen, blit_position=(400, 0))
-            instr = pygame.font.SysFont("couriernew", 24).render(
-                "SPACE: Toggle view | ENTER: Check solution", True, (255, 255, 255)
-            )
-            screen.blit(instr, instr.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50)))
-            level.draw_level_icon(screen)
-            ttt = pygame.font.SysFont("couriernew", 18).render(
-                "Target Shape", True, (255, 255, 255)
-            )
-            screen.blit(ttt, ttt.get_rect(center=(105, 20)))
+            self.board.move_plate(self.selected_plate, (x, y))
+
+    def draw(self):
+        screen = self.screen
+        FONT = self.FONT
+        BUTTON_FONT = self.BUTTON_FONT
+        board = self.board
+        level = self.level
+
+        if self.show_start_screen:
+            screen.blit(pygame.transform.scale(self.start_image, (SCREEN_WIDTH, SCREEN_HEIGHT)), (0, 0))
+            txt = BUTTON_FONT.render("Enter the Game", True, (255, 255, 255))
+            screen.blit(txt, txt.get_rect(center=enter_text_rect.center))
+            if not self.assets.done:
+                loaded, total = self.assets.progress()
+                bar = pygame.Rect(0, 0, 200, 6)
+                bar.midtop = (enter_text_rect.centerx, enter_text_rect.bottom + 10)
+                pygame.draw.rect(screen, (255, 255, 255), bar, 1)
+                pygame.draw.rect(screen, (255, 255, 255), (bar.x, bar.y, bar.width * loaded // total, bar.height))
+
+        elif self.show_instruction_screen:
+            screen.blit(pygame.transform.scale(self.instruction_image, (SCREEN_WIDTH, SCREEN_HEIGHT)), (0, 0))
+            txt = BUTTON_FONT.render("Next>", True, (255, 255, 255))
+            screen.blit(txt, txt.get_rect(center=next_text_rect.center))
+
+        elif self.show_level_select:
+            screen.blit(pygame.transform.scale(self.bg, (SCREEN_WIDTH, SCREEN_HEIGHT)), (0, 0))
+            title_surf = FONT.render("Select Level", True, (255, 255, 255))
+            title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 150))
+            screen.blit(title_surf, title_rect)
+            for lvl, rect in level_buttons:
+                if lvl in self.level_completed:
+                    pygame.draw.rect(screen, (160, 160, 160), rect)
+                else:
+                    pygame.draw.rect(screen, LIGHT_GRID, rect)
+                thumbnail = self.level_thumbnail(lvl)
+                if thumbnail is not None:
+                    screen.blit(thumbnail, thumbnail.get_rect(center=rect.center))
+                pygame.draw.rect(screen, (0, 0, 0), rect, 2)
+                txt = pygame.font.SysFont("couriernew", 24).render(Level.level_names[lvl-1], True, (0, 0, 0))
+                txt_rect = txt.get_rect(center=rect.center)
+                screen.blit(txt, txt_rect)
+            if self.thumbnail_jobs:
+                self.start_thumbnail_render()
+            back_txt = BUTTON_FONT.render("<Back", True, (255, 255, 255))
+            screen.blit(back_txt, back_txt.get_rect(center=back_text_rect.center))
+
+        elif self.show_result_screen:
+            screen.blit(pygame.transform.scale(self.bg, (SCREEN_WIDTH, SCREEN_HEIGHT)), (0, 0))
+            level.draw_level_icon(screen, pos=(160, 60), size=(480, 360))
+            txt = FONT.render(self.result_text, True, (255, 255, 255))
+            screen.blit(txt, txt.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100)))
+            pygame.draw.rect(screen, LIGHT_GRID, home_button)
+            pygame.draw.rect(screen, (0, 0, 0), home_button, 2)
+            txt = BUTTON_FONT.render(self.button_text, True, (0, 0, 0))
+            screen.blit(txt, txt.get_rect(center=home_button.center))
+            # back_txt = BUTTON_FONT.render("<Exit", True, (0, 0, 0))
+            # screen.blit(back_txt, back_txt.get_rect(center=back_text_rect.center))
+            screen.blit(self.home_icon, self.home_icon_rect)
+
         else:
-            board.draw_grid(screen)
-            board.draw_board(screen)
-            draw_color_buttons()
-            instr = pygame.font.SysFont("couriernew", 24).render(
-                "SPACE: Toggle view | ENTER: Check solution", True, (0, 0, 0)
-            )
-            screen.blit(instr, instr.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50)))
-            if selected_color:
-                color_name = "Red" if selected_color == REDD else "Green" if selected_color == GREEND else "Blue"
-                instrSelect = pygame.font.SysFont("couriernew", 16).render(
-                f"Drag controller to move shape | Click controller to color {color_name}", True, (0, 0, 0)
-            )
+            screen.fill(WHITE)
+            screen.blit(self.home_icon, self.home_icon_rect)
+            if self.show_isometric:
+                IsoBoard, IsoProjection = self.load_iso_modules()
+                size = screen.get_size()
+                render_iso = lambda: IsoBoard(board.plates).composite(size)
+                render_proj = lambda: IsoProjection(board.plates, scale=1.8, offset=(10, 80)).composite(size)
+                if self.selected_plate and self.selected_plate.dragging:
+                    # Mid-drag states are never revisited; caching them would
+                    # evict the frames undo/redo and view toggles reuse
+                    iso_frame, proj_frame = render_iso(), render_proj()
+                else:
+                    # Composites are cached by board state, so revisiting a state
+                    # (toggling views, undo/redo) only costs the blits
+                    iso_frame = self.frame_cache.get_or_render("iso", board, size, render_iso)
+                    proj_frame = self.frame_cache.get_or_render("projection", board, size, render_proj)
+                screen.blit(iso_frame, (0, 0))
+                IsoBoard.draw_grid(screen)
+                screen.blit(proj_frame, (400, 0))
+                instr = pygame.font.SysFont("couriernew", 24).render(
+                    "SPACE: Toggle view | ENTER: Check solution", True, (255, 255, 255)
+                )
+                screen.blit(instr, instr.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50)))
+                level.draw_level_icon(screen)
+                ttt = pygame.font.SysFont("couriernew", 18).render(
+                    "Target Shape", True, (255, 255, 255)
+                )
+                screen.blit(ttt, ttt.get_rect(center=(105, 20)))
             else:
-                instrSelect = pygame.font.SysFont("couriernew", 16).render(
-                f"Drag controller to move shape | Select color to assign", True, (0, 0, 0)
-            )
-            screen.blit(instrSelect, instrSelect.get_rect(center=(SCREEN_WIDTH // 2 + 70, 40)))
+                board.draw_grid(screen)
+                board.draw_board(screen)
+                self.draw_color_buttons()
+                instr = pygame.font.SysFont("couriernew", 24).render(
+                    "SPACE: Toggle view | ENTER: Check solution", True, (0, 0, 0)
+                )
+                screen.blit(instr, instr.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50)))
+                if self.selected_color:
+                    color_name = "Red" if self.selected_color == REDD else "Green" if self.selected_color == GREEND else "Blue"
+                    instrSelect = pygame.font.SysFont("couriernew", 16).render(
+                    f"Drag controller to move shape | Click controller to color {color_name}", True, (0, 0, 0)
+                )
+                else:
+                    instrSelect = pygame.font.SysFont("couriernew", 16).render(
+                    f"Drag controller to move shape | Select color to assign", True, (0, 0, 0)
+                )
+                screen.blit(instrSelect, instrSelect.get_rect(center=(SCREEN_WIDTH // 2 + 70, 40)))
+
+
+# === Main Loop ===
+def main(record_path=None, startup_report=False):
+    screen = init_display()
+    startup_timer.mark("display ready")
+    game = Game(screen, startup_timer)
+    recorder = SessionRecorder(record_path) if record_path else None
+
+    frame = 0
+    try:
+        while game.running:
+            # Event Handling
+            for event in pygame.event.get():
+                if recorder:
+                    recorder.record(frame, event)
+                game.handle_event(event)
+
+            # === Drawing ===
+            game.draw()
+            pygame.display.flip()
+            if frame == 0:
+                startup_timer.mark("first frame")
+            frame += 1
+    except BaseException:
+        # Count the frame that raised so a replay reproduces it
+        frame += 1
+        raise
+    finally:
+        if recorder:
+            recorder.close(frame)
+
+    if startup_report:
+        print(startup_timer.report())
+    pygame.quit()
+    sys.exit()
 
-    pygame.display.flip()
 
-pygame.quit()
-sys.exit()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Luminara")
+    parser.add_argument("--record", metavar="PATH",
+                        help="log input events to PATH for replay.py")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print startup timing on exit")
+    args = parser.parse_args()
+    main(record_path=args.record, startup_report=args.startup_report)
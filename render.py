@@ -0,0 +1,269 @@
+# render.py
+
+"""
+Headless batch renderer and on-disk thumbnail cache.
+
+Renders the Board, IsoBoard and IsoProjection views of levels or saved
+board states to PNG without opening a window:
+
+    python render.py --levels 1 2 3 --views board iso projection --out renders
+    python render.py --state my_board.json --views projection --size 320x240
+    python render.py --warm-cache
+
+A board state file is a JSON list of plate specs in the same format as
+`Level.level_data` ({"type", "color", "location", "xys"}).
+
+The iso modules are imported only when an iso view is rendered, so a warm
+cache costs the level-select screen nothing but PNG loads.
+
+Thumbnails are cached under `.thumbnails/`, named by a hash of the view,
+size and plate geometry, so a level is only re-rendered when it changes.
+"""
+
+import argparse
+import json
+import os
+import sys
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, REDD, GREEND, BLUED
+from utils import additive_blend
+from models.board import Board
+from models.level import Level
+
+VIEWS = ("board", "iso", "projection")
+PROJECTION_SCALE = 1.8
+PROJECTION_OFFSET = (10, 80)
+BACKGROUND = additive_blend([REDD, GREEND, BLUED])
+LEVEL_THUMBNAIL_VIEW = "projection"
+LEVEL_THUMBNAIL_SIZE = (116, 56)
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".thumbnails")
+
+
+def board_from_specs(plate_definitions):
+    board = Board()
+    Level.load_definitions(board, plate_definitions)
+    return board
+
+
+def level_board(level_id):
+    return board_from_specs(Level.level_data[level_id])
+
+
+def _points_rect(points, pad=10):
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    rect = pygame.Rect(min(xs) - pad, min(ys) - pad,
+                       max(xs) - min(xs) + 2 * pad, max(ys) - min(ys) + 2 * pad)
+    return rect.clip(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def _crop_to_points(surface, points):
+    # Plates dragged fully off-screen leave nothing to crop to
+    rect = _points_rect(points) if points else None
+    if not rect or rect.width == 0 or rect.height == 0:
+        return surface
+    return surface.subsurface(rect)
+
+
+def render_view(plates, view):
+    """Render one view of `plates` and return it cropped to its content."""
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    surface.fill(BACKGROUND)
+
+    if view == "board":
+        board = Board()
+        for plate in plates:
+            board.add_plate(plate)
+        board.draw_grid(surface)
+        board.draw_board(surface)
+        return surface.subsurface(pygame.Rect(board.boardStartX, board.boardStartY,
+                                              board.width + 1, board.height + 1))
+
+    if view == "iso":
+        from models.iso_board import IsoBoard
+        iso_board = IsoBoard(plates)
+        iso_board.draw_board(surface)
+        iso_board.draw_grid(surface)
+        corners = [IsoBoard.conversion(x, y) for x in (0, 40) for y in (0, 30)]
+        points = corners + [p for plate in iso_board.isoPlates for p in plate[2]]
+        return _crop_to_points(surface, points)
+
+    if view == "projection":
+        from models.iso_projection import IsoProjection
+        iso_proj = IsoProjection(plates, scale=PROJECTION_SCALE, offset=PROJECTION_OFFSET)
+        iso_proj.draw_projection(surface, blit_position=(0, 0))
+        points = [p for plate in iso_proj.isoPlates for p in plate[2]]
+        return _crop_to_points(surface, points)
+
+    raise ValueError(f"unknown view {view!r}, expected one of {VIEWS}")
+
+
+def fit_to_size(surface, size):
+    """Scale `surface` to fit inside `size` keeping its aspect, centered on black."""
+    width, height = surface.get_size()
+    ratio = min(size[0] / width, size[1] / height)
+    scaled = pygame.transform.smoothscale(
+        surface, (max(1, int(width * ratio)), max(1, int(height * ratio))))
+    result = pygame.Surface(size)
+    result.blit(scaled, scaled.get_rect(center=(size[0] // 2, size[1] // 2)))
+    return result
+
+
+def render_thumbnail(plates, view, size):
+    return fit_to_size(render_view(plates, view), size)
+
+
+class ThumbnailCache:
+    """Content-addressed PNG cache keyed by view, size and plate geometry."""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def path_for(self, board, view, size):
+        key = f"{view}-{size[0]}x{size[1]}-{board.state_hash()}"
+        return os.path.join(self.cache_dir, key + ".png")
+
+    def contains(self, board, view, size):
+        return os.path.exists(self.path_for(board, view, size))
+
+    def load(self, board, view, size):
+        """Return the cached thumbnail, or None if it is missing or unreadable."""
+        path = self.path_for(board, view, size)
+        if not os.path.exists(path):
+            return None
+        try:
+            return pygame.image.load(path)
+        except (pygame.error, OSError):
+            return None
+
+    def put(self, path, surface):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write then rename so a concurrent reader never sees a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp.png"
+        pygame.image.save(surface, tmp_path)
+        os.replace(tmp_path, path)
+
+
+# === Batch Rendering ===
+def _render_job(job):
+    name, plate_definitions, view, size, out_path = job
+    board = board_from_specs(plate_definitions)
+    if size:
+        surface = render_thumbnail(board.plates, view, size)
+    else:
+        surface = render_view(board.plates, view)
+    if out_path:
+        os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+        pygame.image.save(surface, out_path)
+    else:
+        cache = ThumbnailCache()
+        cache.put(cache.path_for(board, view, size), surface)
+    return name, view, out_path
+
+
+def render_batch(jobs, workers=None, on_done=None):
+    """
+    Render jobs and return one (name, view, out_path, error) outcome per job,
+    where error is None on success. A failing job does not stop the others.
+    `on_done(outcome)` is called as each job finishes.
+    """
+    outcomes = []
+
+    def finish(job, error):
+        name, _, view, _, out_path = job
+        outcomes.append((name, view, out_path, error))
+        if on_done:
+            on_done(outcomes[-1])
+
+    if workers == 1:
+        for job in jobs:
+            try:
+                _render_job(job)
+                finish(job, None)
+            except Exception as e:
+                finish(job, e)
+        return outcomes
+
+    # Imported here so loading cached thumbnails does not pull in multiprocessing
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    # Spawn rather than fork: the caller may have threads and a display open
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {pool.submit(_render_job, job): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                future.result()
+                finish(futures[future], None)
+            except Exception as e:
+                finish(futures[future], e)
+    return outcomes
+
+
+def load_state(path):
+    with open(path) as f:
+        specs = json.load(f)
+    for spec in specs:
+        # Plates without a color default to GRAY in Level.load_definitions
+        if 'color' in spec:
+            spec['color'] = tuple(spec['color'])
+        spec['location'] = tuple(spec['location'])
+        spec['xys'] = [tuple(xy) for xy in spec['xys']]
+    return specs
+
+
+def parse_size(text):
+    width, height = text.lower().split("x")
+    return (int(width), int(height))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render Luminara boards to PNG headless")
+    parser.add_argument("--levels", type=int, nargs="*", default=None,
+                        choices=sorted(Level.level_data), help="level ids to render (default: all)")
+    parser.add_argument("--state", action="append", default=[],
+                        help="JSON board state file to render (repeatable)")
+    parser.add_argument("--views", nargs="+", choices=VIEWS, default=list(VIEWS))
+    parser.add_argument("--size", type=parse_size, default=None,
+                        help="thumbnail size WxH (default: full-size crop)")
+    parser.add_argument("--out", default="renders", help="output directory")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--warm-cache", action="store_true",
+                        help="fill the level-select thumbnail cache instead")
+    args = parser.parse_args()
+
+    if args.warm_cache:
+        cache = ThumbnailCache()
+        jobs = [(f"level{lvl}", specs, LEVEL_THUMBNAIL_VIEW, LEVEL_THUMBNAIL_SIZE, None)
+                for lvl, specs in sorted(Level.level_data.items())
+                if not cache.contains(board_from_specs(specs), LEVEL_THUMBNAIL_VIEW, LEVEL_THUMBNAIL_SIZE)]
+        outcomes = render_batch(jobs, workers=args.workers)
+        errors = [(name, error) for name, _, _, error in outcomes if error is not None]
+        for name, error in errors:
+            print(f"{name}: {error}", file=sys.stderr)
+        print(f"rendered {len(jobs) - len(errors)} thumbnail(s), "
+              f"{len(Level.level_data) - len(jobs)} already cached")
+        sys.exit(1 if errors else 0)
+
+    sources = []
+    if args.levels is not None or not args.state:
+        for lvl in args.levels or sorted(Level.level_data):
+            sources.append((f"level{lvl}", Level.level_data[lvl]))
+    for path in args.state:
+        sources.append((os.path.splitext(os.path.basename(path))[0], load_state(path)))
+
+    jobs = [(name, specs, view, args.size, os.path.join(args.out, f"{name}_{view}.png"))
+            for name, specs in sources for view in args.views]
+    failed = False
+    for name, view, out_path, error in render_batch(jobs, workers=args.workers):
+        if error is None:
+            print(out_path)
+        else:
+            print(f"{name} ({view}): {error}", file=sys.stderr)
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+# replay.py
+
+"""
+Session record/replay for performance and correctness regressions.
+
+Recording:  python prism.py --record session.prs
+Replaying:  python replay.py session.prs [--unthrottled] [--expect-hash HASH]
+
+A session file is a short header followed by fixed-size records, one per
+input event: (frame, time in ms, event code, x, y, button/key). For key
+events x holds the modifier flags. A final END record holds the total
+number of frames drawn and the session length, so frames without input
+are replayed too.
+
+Replay runs the events through the same `Game` state machine under the
+dummy video driver, draws every recorded frame, and prints the frame-time
+distribution together with the final board state hash.
+"""
+
+import argparse
+import os
+import struct
+import sys
+import time
+import pygame
+
+MAGIC = b"PRS1"
+RECORD = struct.Struct("<IIBhhI")
+
+# Only the events the game reacts to are recorded
+EVENT_CODES = {
+    pygame.QUIT: 0,
+    pygame.MOUSEBUTTONDOWN: 1,
+    pygame.MOUSEBUTTONUP: 2,
+    pygame.MOUSEMOTION: 3,
+    pygame.KEYDOWN: 4,
+}
+EVENT_TYPES = {code: event_type for event_type, code in EVENT_CODES.items()}
+END_CODE = 255
+# Flush to disk at least this often so a killed process loses little input
+FLUSH_EVERY_FRAMES = 60
+
+
+class SessionRecorder:
+    def __init__(self, path):
+        self.file = open(path, "wb")
+        self.file.write(MAGIC)
+        self.start = time.perf_counter()
+        self.flushed_frame = 0
+
+    def record(self, frame, event):
+        code = EVENT_CODES.get(event.type)
+        if code is None:
+            return
+        t_ms = int((time.perf_counter() - self.start) * 1000)
+        if event.type == pygame.KEYDOWN:
+            # Keep the modifier keys (ctrl, shift, ...) in the unused x field
+            x, y = event.mod & 0x0FFF, 0
+        else:
+            x, y = getattr(event, "pos", (0, 0))
+        value = getattr(event, "button", getattr(event, "key", 0))
+        self.file.write(RECORD.pack(frame, t_ms, code, x, y, value))
+        if frame - self.flushed_frame >= FLUSH_EVERY_FRAMES:
+            self.file.flush()
+            self.flushed_frame = frame
+
+    def close(self, frame_count):
+        t_ms = int((time.perf_counter() - self.start) * 1000)
+        self.file.write(RECORD.pack(frame_count, t_ms, END_CODE, 0, 0, 0))
+        self.file.close()
+
+
+def load_session(path):
+    """Return (events, frame count, session length in ms)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a recorded session")
+
+    # A killed recorder can leave a partial record at the end; drop it
+    payload = data[len(MAGIC):]
+    payload = payload[:len(payload) - len(payload) % RECORD.size]
+
+    events = []
+    end = None
+    for frame, t_ms, code, x, y, value in RECORD.iter_unpack(payload):
+        if code == END_CODE:
+            end = (frame, t_ms)
+            continue
+        event_type = EVENT_TYPES[code]
+        if event_type == pygame.KEYDOWN:
+            attrs = {"key": value, "mod": x}
+        elif event_type == pygame.QUIT:
+            attrs = {}
+        elif event_type == pygame.MOUSEMOTION:
+            attrs = {"pos": (x, y)}
+        else:
+            attrs = {"pos": (x, y), "button": value}
+        events.append((frame, t_ms, pygame.event.Event(event_type, attrs)))
+
+    if end is None:
+        # Recording was cut short; replay up to the last frame with input
+        end = (events[-1][0] + 1, events[-1][1]) if events else (0, 0)
+    return events, end[0], end[1]
+
+
+def frame_schedule(events, frame_count, end_ms):
+    """
+    Return the target start time in ms of every frame. Frames with input
+    use their first event's time; idle frames are spaced evenly between
+    the surrounding frames with input.
+    """
+    anchors = {0: 0}
+    for frame, t_ms, _ in events:
+        anchors.setdefault(frame, t_ms)
+    anchors.setdefault(frame_count, end_ms)
+    known = sorted(anchors.items())
+
+    schedule = []
+    for (f0, t0), (f1, t1) in zip(known, known[1:]):
+        for frame in range(f0, f1):
+            schedule.append(t0 + (t1 - t0) * (frame - f0) / (f1 - f0))
+    return schedule[:frame_count]
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def summarize_frame_times(frame_times):
+    ordered = sorted(frame_times)
+    return {
+        "frames": len(ordered),
+        "mean_ms": sum(ordered) / len(ordered) if ordered else 0.0,
+        "p50_ms": percentile(ordered, 50),
+        "p95_ms": percentile(ordered, 95),
+        "p99_ms": percentile(ordered, 99),
+        "max_ms": ordered[-1] if ordered else 0.0,
+    }
+
+
+def replay_session(path, unthrottled=False):
+    """Replay a session headless and return (frame time summary, board hash)."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import prism
+
+    events, frame_count, end_ms = load_session(path)
+    screen = prism.init_display()
+    game = prism.Game(screen, thumbnails=False)
+
+    # Group events by the frame they were recorded in
+    frame_events = {}
+    for frame, t_ms, event in events:
+        frame_events.setdefault(frame, []).append(event)
+
+    frame_times = []
+    start = time.perf_counter()
+    for frame, t_ms in enumerate(frame_schedule(events, frame_count, end_ms)):
+        if not unthrottled:
+            delay = t_ms / 1000 - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+
+        frame_start = time.perf_counter()
+        for event in frame_events.get(frame, ()):
+            game.handle_event(event)
+        game.draw()
+        pygame.display.flip()
+        frame_times.append((time.perf_counter() - frame_start) * 1000)
+
+        if not game.running:
+            break
+
+    board_hash = game.board.state_hash()
+    pygame.quit()
+    return summarize_frame_times(frame_times), board_hash
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded Luminara session")
+    parser.add_argument("session", help="file written by prism.py --record")
+    parser.add_argument("--unthrottled", action="store_true",
+                        help="replay as fast as possible instead of at recorded speed")
+    parser.add_argument("--expect-hash", metavar="HASH",
+                        help="exit with status 1 if the final board hash differs")
+    args = parser.parse_args()
+
+    summary, board_hash = replay_session(args.session, unthrottled=args.unthrottled)
+    print(f"frames: {summary['frames']}")
+    for key in ("mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"):
+        print(f"{key[:-3]}: {summary[key]:.2f} ms")
+    print(f"board hash: {board_hash}")
+
+    if args.expect_hash and args.expect_hash != board_hash:
+        print(f"board hash mismatch, expected {args.expect_hash}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
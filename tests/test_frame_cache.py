@@ -0,0 +1,40 @@
+# tests/test_frame_cache.py
+
+import pygame
+from frame_cache import FrameCache
+from render import level_board
+
+
+def test_frame_cache_evicts_least_recently_used_by_bytes():
+    surface = pygame.Surface((10, 10))
+    frame_bytes = FrameCache._surface_bytes(surface)
+    cache = FrameCache(max_bytes=int(frame_bytes * 2.5))
+    boards = [level_board(level_id) for level_id in (1, 2, 3)]
+
+    cache.get_or_render("iso", boards[0], (10, 10), lambda: surface)
+    cache.get_or_render("iso", boards[1], (10, 10), lambda: surface)
+    # Touch the first entry so the second one becomes least recently used
+    cache.get_or_render("iso", boards[0], (10, 10), lambda: surface)
+    cache.get_or_render("iso", boards[2], (10, 10), lambda: surface)
+
+    assert cache.size_bytes == 2 * frame_bytes
+    assert cache.hits == 1 and cache.misses == 3
+    renders = []
+    cache.get_or_render("iso", boards[1], (10, 10), lambda: renders.append(1) or surface)
+    assert renders == [1]
+
+
+def test_frame_cache_collision_with_different_state_is_a_miss():
+    cache = FrameCache()
+    first = level_board(1)
+    second = level_board(2)
+    # Force the second board onto the first board's key
+    second._frame_key = first.frame_key()
+
+    cached = pygame.Surface((4, 4))
+    cache.get_or_render("iso", first, (4, 4), lambda: cached)
+    fresh = pygame.Surface((4, 4))
+    result = cache.get_or_render("iso", second, (4, 4), lambda: fresh)
+
+    assert result is fresh
+    assert cache.misses == 2 and cache.hits == 0
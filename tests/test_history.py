@@ -0,0 +1,72 @@
+# tests/test_history.py
+
+import random
+from constants import REDD, GREEND, BLUED
+from models.board import Board
+from models.history import History
+from render import level_board
+
+
+def rehashed_key(board):
+    fresh = Board()
+    for plate in board.plates:
+        fresh.add_plate(plate)
+    return fresh.frame_key()
+
+
+def random_edit(board, history, rng):
+    plate = rng.choice(board.plates)
+    if rng.random() < 0.5:
+        old_index = board.plates.index(plate)
+        old_location = plate.plate_location
+        board.bring_to_top(plate)
+        board.move_plate(plate, (rng.randint(0, 40), rng.randint(0, 30)))
+        history.record_move(plate, old_index, old_location)
+    else:
+        old_color = plate.plate_color
+        board.set_plate_color(plate, rng.choice([REDD, GREEND, BLUED]))
+        history.record_color(plate, old_color)
+
+
+def test_frame_key_matches_full_rehash_after_every_mutation():
+    rng = random.Random(0)
+    board = level_board(6)
+    history = History(board)
+    for _ in range(200):
+        random_edit(board, history, rng)
+        assert board.frame_key() == rehashed_key(board)
+        if rng.random() < 0.3:
+            history.undo()
+            assert board.frame_key() == rehashed_key(board)
+
+
+def test_undo_all_and_redo_all_round_trip():
+    rng = random.Random(1)
+    board = level_board(1)
+    history = History(board)
+    start_hash, start_key = board.state_hash(), board.frame_key()
+    for _ in range(50):
+        random_edit(board, history, rng)
+    end_hash, end_key = board.state_hash(), board.frame_key()
+
+    while history.undo():
+        pass
+    assert (board.state_hash(), board.frame_key()) == (start_hash, start_key)
+
+    while history.redo():
+        pass
+    assert (board.state_hash(), board.frame_key()) == (end_hash, end_key)
+
+
+def test_new_edit_clears_redo():
+    board = level_board(3)
+    history = History(board)
+    plate = board.plates[0]
+    old_color = plate.plate_color
+    board.set_plate_color(plate, REDD)
+    history.record_color(plate, old_color)
+    history.undo()
+    old_color = plate.plate_color
+    board.set_plate_color(plate, BLUED)
+    history.record_color(plate, old_color)
+    assert not history.redo()
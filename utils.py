@@ -1,5 +1,7 @@
 # utils.py
 
+import time
+
 def additive_blend(colors):
     r = g = b = 0
     for cr, cg, cb, ca in colors:
@@ -8,3 +10,21 @@ def additive_blend(colors):
         g += cg * alpha
         b += cb * alpha
     return (min(int(r), 255), min(int(g), 255), min(int(b), 255), 255)
+
+
+class StartupTimer:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks = []
+        self.labels = set()
+
+    def mark(self, label):
+        if label not in self.labels:
+            self.labels.add(label)
+            self.marks.append((label, (time.perf_counter() - self.start) * 1000))
+
+    def report(self):
+        lines = ["startup timing:"]
+        for label, ms in self.marks:
+            lines.append(f"  {label:<24}{ms:9.1f} ms")
+        return "\n".join(lines)